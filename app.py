@@ -1,18 +1,78 @@
+import io
 import os
+import hmac
+import logging
 import json
 import random
 import time
+import queue
+import atexit
+import uuid
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
+from functools import lru_cache
+
+# HTTP client imports
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Serialization and caching imports
+import orjson
+from cachetools import TTLCache
 
 # Flask and SQLAlchemy imports
 from flask import Flask, render_template, request, jsonify, send_file
+from flask.json.provider import JSONProvider
+from werkzeug.utils import secure_filename
+from sqlalchemy import lambda_stmt
 from sqlalchemy.exc import SQLAlchemyError
 
 # Database utility from local file
 from database import db, CaseQueryLog
 
 # --- Flask App Initialization ---
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson; serializes datetimes natively (naive as UTC).
+
+    Of the json.dumps arguments only sort_keys, indent=2, default and compact
+    separators (orjson's only output style, used by Flask's session cookie)
+    are supported; anything else raises rather than being silently ignored.
+    """
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(self, obj, sort_keys=False, indent=None, default=None, separators=None, **kwargs):
+        if separators is not None and tuple(separators) != (',', ':'):
+            raise ValueError("orjson only supports compact separators (',', ':')")
+        if kwargs:
+            raise TypeError(f"Unsupported JSON dumps argument(s): {', '.join(kwargs)}")
+        option = self.option
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent is not None:
+            if indent != 2:
+                raise ValueError("orjson only supports indent=2")
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._dumps(obj, **kwargs).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            raise TypeError(f"Unsupported JSON loads argument(s): {', '.join(kwargs)}")
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps(obj), mimetype='application/json')
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configure SQLAlchemy (using SQLite for simplicity and portability)
 # NOTE: Replace 'sqlite:///site.db' with your Postgres connection string for production.
@@ -20,11 +80,58 @@ app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///site.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = 'a_very_secret_key_for_session_management'
 
+# Adds a random 1-2.5s delay to simulated scrapes; set SIMULATE_LATENCY=0 to disable.
+app.config['SIMULATE_LATENCY'] = os.environ.get('SIMULATE_LATENCY', '1') == '1'
+
+# Request threads per worker process; read by gunicorn.conf.py as well so
+# the connection pool always matches the number of threads using it.
+WEB_THREADS = int(os.environ.get('WEB_THREADS', 32))
+
+# Connection pool tuning: one connection per request thread plus one for the
+# log writer. SQLite connections are shared with the log writer thread, so
+# the same-thread check is disabled for them.
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': WEB_THREADS + 1,
+    'pool_pre_ping': True,
+}
+if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS']['connect_args'] = {'check_same_thread': False}
+
 # Initialize the database with the Flask app
 db.init_app(app)
 
+# Keep per-statement SQL logging out of production logs
+if not app.debug:
+    logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
+
+# --- Shared HTTP Session ---
+
+# eCourts case status portal (used by the real scraper)
+ECOURTS_URL = 'https://services.ecourts.gov.in/ecourtindia_v6/'
+
+# A single pooled session, reused across requests and threads, so repeated
+# lookups keep their TCP/TLS connections alive instead of reconnecting.
+HTTP = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+HTTP.mount('http://', _adapter)
+HTTP.mount('https://', _adapter)
+HTTP.headers.update({
+    'User-Agent': 'Mozilla/5.0 (compatible; CourtDataFetcher/1.0)',
+    'Accept': 'text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8',
+})
+atexit.register(HTTP.close)
+
 # --- Mock Data and Utilities ---
 
+@lru_cache(maxsize=1)
+def today_str(day_ordinal):
+    """Returns today's date as DD-MM-YYYY, formatted once per day_ordinal."""
+    return date.fromordinal(day_ordinal).strftime('%d-%m-%Y')
+
 # Mock data mimicking eCourts responses for demonstration
 MOCK_CASE_DATA = {
     # Success Case 1: Active case
@@ -53,39 +160,128 @@ MOCK_CASE_DATA = {
     },
 }
 
+# Scrape results for the static mock data, serialized once at import
+MOCK_RESPONSES = {
+    case_key: {'status': 'success', 'data': data, 'raw_response': json.dumps(data)}
+    for case_key, data in MOCK_CASE_DATA.items()
+}
+
+# CAPTCHAs are drawn from the OS CSPRNG so they cannot be predicted
+CAPTCHA_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+CAPTCHA_RNG = random.SystemRandom()
+
 # Generate a random 4-char CAPTCHA
 def generate_captcha():
     """Generates a random alphanumeric CAPTCHA."""
-    chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
-    return ''.join(random.choice(chars) for _ in range(4))
+    return ''.join(CAPTCHA_RNG.choices(CAPTCHA_CHARS, k=4))
+
+# Pool of pre-generated CAPTCHAs; about half of the requests are served a
+# random pooled entry so generation cost (tiny for text, large for images)
+# is amortized across requests.
+CAPTCHA_POOL_SIZE = 256
+CAPTCHA_POOL = collections.deque(maxlen=CAPTCHA_POOL_SIZE)
+CAPTCHA_POOL_LOCK = threading.Lock()
+
+def fill_captcha_pool():
+    """Pre-generates CAPTCHA_POOL_SIZE CAPTCHAs into the pool."""
+    for _ in range(CAPTCHA_POOL_SIZE):
+        captcha = generate_captcha()
+        with CAPTCHA_POOL_LOCK:
+            CAPTCHA_POOL.append(captcha)
+
+def get_captcha():
+    """Returns a CAPTCHA, reusing a pooled one with 50% probability."""
+    with CAPTCHA_POOL_LOCK:
+        if CAPTCHA_POOL and random.random() < 0.5:
+            return random.choice(CAPTCHA_POOL)
+    captcha = generate_captcha()
+    with CAPTCHA_POOL_LOCK:
+        CAPTCHA_POOL.append(captcha)
+    return captcha
+
+# Issued CAPTCHAs by challenge id. The answer never leaves the server
+# except as the displayed text, and each challenge can be used only once.
+CAPTCHA_CHALLENGES = TTLCache(maxsize=100_000, ttl=120)
+CAPTCHA_CHALLENGES_LOCK = threading.Lock()
+
+def issue_captcha_challenge():
+    """Issues a CAPTCHA and returns (challenge_id, captcha)."""
+    captcha = get_captcha()
+    challenge_id = uuid.uuid4().hex
+    with CAPTCHA_CHALLENGES_LOCK:
+        CAPTCHA_CHALLENGES[challenge_id] = captcha
+    return challenge_id, captcha
+
+def pop_captcha_challenge(challenge_id):
+    """Consumes a challenge, returning its CAPTCHA or None if unknown/expired."""
+    with CAPTCHA_CHALLENGES_LOCK:
+        return CAPTCHA_CHALLENGES.pop(challenge_id, None)
+
+def has_captcha_fields(data):
+    """Checks that the CAPTCHA id and solution of a search request are strings."""
+    return isinstance(data.get('captchaId'), str) and isinstance(data.get('captchaSolution'), str)
+
+def captcha_matches(solution, expected):
+    """Checks a user's solution against an (upper-case) CAPTCHA in constant time."""
+    solution = solution.strip().upper()
+    if len(solution) != len(expected):
+        return False
+    return hmac.compare_digest(solution.encode(), expected.encode())
 
 # --- Core Scraper Simulation Function ---
 
+# Recent scrape results keyed by case key. Errors get a shorter TTL so a
+# transient portal failure is not served for long.
+SCRAPE_CACHE = TTLCache(maxsize=1024, ttl=300)
+SCRAPE_ERROR_CACHE = TTLCache(maxsize=1024, ttl=30)
+SCRAPE_CACHE_LOCK = threading.Lock()
+
+# Process-wide cap on scrapes in flight against the portal, shared by single
+# and batch searches across all request threads so the portal is not flooded.
+MAX_CONCURRENT_SCRAPES = 10
+SCRAPE_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_SCRAPES)
+
 def scrape_case_data(case_key: str):
+    """Returns the scrape result for case_key, served from cache while fresh."""
+    with SCRAPE_CACHE_LOCK:
+        cached = SCRAPE_CACHE.get(case_key) or SCRAPE_ERROR_CACHE.get(case_key)
+    if cached is not None:
+        return cached
+
+    with SCRAPE_SLOTS:
+        result = _scrape_case_data(case_key)
+    with SCRAPE_CACHE_LOCK:
+        cache = SCRAPE_CACHE if result['status'] == 'success' else SCRAPE_ERROR_CACHE
+        cache[case_key] = result
+    return result
+
+def _scrape_case_data(case_key: str):
     """
     Simulates the scraping of eCourts data.
 
+    The scrape blocks the calling thread for its whole (I/O-bound) duration;
+    concurrency comes from the server's worker threads and, for batch
+    searches, from SCRAPE_EXECUTOR.
+
     In a real application, this function would handle:
-    1. HTTP session initialization (using requests.Session).
+    1. Requesting the portal through the shared `HTTP` session
+       (e.g. HTTP.get(ECOURTS_URL, params=..., timeout=10)).
     2. Fetching the initial page to get cookies/state information.
     3. Sending the search query (Case Type/Number/Year).
     4. Solving the CAPTCHA (requires external service or local model).
     5. Parsing the results using BeautifulSoup or similar library.
     6. Extracting specific fields (parties, dates, status, orders).
     """
-    app.logger.info(f"Simulating scrape for key: {case_key}")
+    if app.logger.isEnabledFor(logging.INFO):
+        app.logger.info("Simulating scrape for key: %s", case_key)
     
     # Simulate network delay
-    time.sleep(random.uniform(1.0, 2.5))
+    if app.config.get('SIMULATE_LATENCY'):
+        time.sleep(random.uniform(1.0, 2.5))
     
-    if case_key in MOCK_CASE_DATA:
+    if case_key in MOCK_RESPONSES:
         # Success scenario
-        data = MOCK_CASE_DATA[case_key]
-        return {
-            'status': 'success',
-            'data': data,
-            'raw_response': json.dumps(data)
-        }
+        return MOCK_RESPONSES[case_key]
     else:
         # Failure scenario: Case Not Found / Invalid Input
         error_msg = f"Case {case_key} not found on the portal or invalid input format."
@@ -97,22 +293,95 @@ def scrape_case_data(case_key: str):
 
 # --- Database Storage Function ---
 
+# Query logs are queued by request handlers and written in batches by a
+# background thread, so a search never waits on its own INSERT/COMMIT. The
+# queue is bounded so a stalled database cannot grow it without limit.
+LOG_QUEUE = queue.Queue(maxsize=10_000)
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL = 0.5  # seconds
+LOG_STOP = object()  # Queued on shutdown to tell the writer to finish up
+LOG_WRITER = None
+
 def log_query(case_type, case_number, year, status, raw_response):
-    """Stores the query details and raw response in the database."""
+    """Queues the query details and raw response for storage in the database."""
     try:
-        new_log = CaseQueryLog(
-            case_type=case_type,
-            case_number=case_number,
-            filing_year=year,
-            status=status,
-            raw_response=raw_response[:1000] # Truncate large responses
-        )
-        db.session.add(new_log)
-        db.session.commit()
-        app.logger.info(f"Query logged successfully: {case_type} {case_number}/{year}")
-    except SQLAlchemyError as e:
-        db.session.rollback()
-        app.logger.error(f"Database Error: Failed to log query: {e}")
+        LOG_QUEUE.put_nowait({
+            'case_type': case_type,
+            'case_number': case_number,
+            'filing_year': year,
+            'status': status,
+            'raw_response': raw_response[:1000], # Truncate large responses
+            'timestamp': datetime.utcnow(),
+        })
+    except queue.Full:
+        app.logger.error("Log queue full: dropped query log for %s %s/%s", case_type, case_number, year)
+
+def write_logs(rows):
+    """
+    Stores a batch of queued log rows with one executemany INSERT and a single
+    commit. If the batch fails, rows are retried one at a time so a single bad
+    row cannot drop the logs of other searches in the same batch.
+    """
+    with app.app_context():
+        try:
+            db.session.execute(db.insert(CaseQueryLog), rows)
+            db.session.commit()
+            app.logger.info("Logged %d queries successfully", len(rows))
+            return
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            app.logger.error("Database Error: Failed to log %d queries, retrying one by one: %s", len(rows), e)
+
+        for row in rows:
+            try:
+                db.session.execute(db.insert(CaseQueryLog), [row])
+                db.session.commit()
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                app.logger.error("Database Error: Failed to log query %s %s/%s: %s",
+                                 row['case_type'], row['case_number'], row['filing_year'], e)
+
+def _log_writer():
+    """
+    Drains LOG_QUEUE, flushing every LOG_BATCH_SIZE rows or LOG_FLUSH_INTERVAL,
+    until LOG_STOP is received. Rows queued before LOG_STOP are always written.
+    """
+    stopping = False
+    while not stopping:
+        row = LOG_QUEUE.get()
+        if row is LOG_STOP:
+            break
+        rows = [row]
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+        while len(rows) < LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                row = LOG_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if row is LOG_STOP:
+                stopping = True
+                break
+            rows.append(row)
+        try:
+            write_logs(rows)
+        except Exception:
+            # Keep the writer alive; otherwise every later log would pile up unwritten
+            app.logger.exception("Log writer failed to store %d queries", len(rows))
+
+def stop_log_writer():
+    """Signals the log writer to write out everything queued so far, then waits for it."""
+    LOG_QUEUE.put(LOG_STOP)
+    LOG_WRITER.join()
+
+def start_log_writer():
+    """Starts the background thread that persists queued query logs."""
+    global LOG_WRITER
+    LOG_WRITER = threading.Thread(target=_log_writer, name='log-writer', daemon=True)
+    LOG_WRITER.start()
+    atexit.register(stop_log_writer)
 
 # --- Flask Routes ---
 
@@ -121,6 +390,10 @@ def index():
     """Renders the main application interface."""
     return render_template('index.html')
 
+def is_search_value(value):
+    """Checks that a case search field is a plain string or integer (e.g. a year)."""
+    return isinstance(value, (str, int)) and not isinstance(value, bool)
+
 @app.route('/api/search_case', methods=['POST'])
 def search_case():
     """API endpoint to handle the case search request."""
@@ -129,13 +402,16 @@ def search_case():
     case_number = data.get('caseNumber')
     year = data.get('year')
     captcha_solution = data.get('captchaSolution')
-    generated_captcha = data.get('generatedCaptcha')
+    captcha_id = data.get('captchaId')
 
-    if not all([case_type, case_number, year, captcha_solution, generated_captcha]):
+    if (not all([case_type, case_number, year, captcha_solution, captcha_id])
+            or not all(map(is_search_value, [case_type, case_number, year]))
+            or not has_captcha_fields(data)):
         return jsonify({'status': 'error', 'message': 'Missing required search parameters.'}), 400
 
     # 1. CAPTCHA Validation
-    if captcha_solution.upper() != generated_captcha.upper():
+    generated_captcha = pop_captcha_challenge(captcha_id)
+    if generated_captcha is None or not captcha_matches(captcha_solution, generated_captcha):
         log_query(case_type, case_number, year, 'Failed (CAPTCHA)', 'CAPTCHA mismatch')
         return jsonify({'status': 'error', 'message': 'Invalid CAPTCHA solution. Please try again.'})
 
@@ -152,12 +428,62 @@ def search_case():
     else:
         return jsonify({'status': 'error', 'message': result['message']})
 
+# Upper bound on cases per batch search
+MAX_BATCH_CASES = 20
+
+# Threads that run the scrapes of batch searches in parallel; more would only
+# wait on SCRAPE_SLOTS.
+SCRAPE_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SCRAPES, thread_name_prefix='scrape')
+
+@app.route('/api/search_cases', methods=['POST'])
+def search_cases():
+    """API endpoint to search several cases at once, scraping them concurrently."""
+    data = request.json
+    if not isinstance(data, dict):
+        return jsonify({'status': 'error', 'message': 'Missing required search parameters.'}), 400
+    cases = data.get('cases')
+    captcha_solution = data.get('captchaSolution')
+    captcha_id = data.get('captchaId')
+
+    if not cases or not isinstance(cases, list) or not all([captcha_solution, captcha_id]) or not has_captcha_fields(data):
+        return jsonify({'status': 'error', 'message': 'Missing required search parameters.'}), 400
+    if len(cases) > MAX_BATCH_CASES:
+        return jsonify({'status': 'error', 'message': f'At most {MAX_BATCH_CASES} cases can be searched at once.'}), 400
+
+    queries = []
+    for case in cases:
+        query = (case.get('caseType'), case.get('caseNumber'), case.get('year')) if isinstance(case, dict) else ()
+        if not query or not all(query) or not all(map(is_search_value, query)):
+            return jsonify({'status': 'error', 'message': 'Missing required search parameters.'}), 400
+        queries.append(query)
+
+    # 1. CAPTCHA Validation (one CAPTCHA covers the whole batch)
+    generated_captcha = pop_captcha_challenge(captcha_id)
+    if generated_captcha is None or not captcha_matches(captcha_solution, generated_captcha):
+        for case_type, case_number, year in queries:
+            log_query(case_type, case_number, year, 'Failed (CAPTCHA)', 'CAPTCHA mismatch')
+        return jsonify({'status': 'error', 'message': 'Invalid CAPTCHA solution. Please try again.'})
+
+    # 2. Concurrent Case Search Simulation
+    case_keys = [f"{case_type}/{case_number}/{year}" for case_type, case_number, year in queries]
+    results = list(SCRAPE_EXECUTOR.map(scrape_case_data, case_keys))
+
+    # 3. Log each query result and return them in request order
+    results_data = []
+    for (case_type, case_number, year), case_key, result in zip(queries, case_keys, results):
+        log_query(case_type, case_number, year, result['status'], result['raw_response'])
+        if result['status'] == 'success':
+            results_data.append({'caseKey': case_key, 'status': 'success', 'data': result['data']})
+        else:
+            results_data.append({'caseKey': case_key, 'status': 'error', 'message': result['message']})
+    return jsonify({'status': 'success', 'results': results_data})
+
 @app.route('/api/generate_captcha', methods=['GET'])
 def generate_new_captcha():
-    """API endpoint to get a new CAPTCHA image/text."""
+    """API endpoint to get a new CAPTCHA image/text and its challenge ID."""
     # In a real app, this would fetch the CAPTCHA image and return its text/ID
-    captcha = generate_captcha()
-    return jsonify({'status': 'success', 'captcha': captcha})
+    captcha_id, captcha = issue_captcha_challenge()
+    return jsonify({'status': 'success', 'captcha': captcha, 'captchaId': captcha_id})
 
 @app.route('/api/download/<filename>', methods=['GET'])
 def download_file(filename):
@@ -173,48 +499,74 @@ def download_file(filename):
         content += "The original file would be a PDF downloaded from the eCourts portal."
         mime_type = 'text/plain' # Change to 'application/pdf' for real PDFs
     elif 'causelist' in filename:
-        content = f"--- MOCK CAUSE LIST for {date.today().strftime('%d-%m-%Y')} ---\n\n"
+        content = f"--- MOCK CAUSE LIST for {today_str(date.today().toordinal())} ---\n\n"
         content += "1. Case HMA/133/2025: Ramesh Kumar vs. Sapna Devi (For Hearing)\n"
         content += "2. Case XYZ/12/2024: (New Filing)\n"
         mime_type = 'text/plain'
     else:
         return jsonify({'status': 'error', 'message': 'File not found'}), 404
 
-    # Create a temporary file to serve the content
-    temp_path = os.path.join('/tmp', filename)
-    with open(temp_path, 'w') as f:
-        f.write(content)
+    # Serve the content straight from memory; real PDFs fetched from the portal
+    # should be streamed in chunks via Response(stream_with_context(...)).
+    buf = io.BytesIO(content.encode('utf-8'))
+    download_name = secure_filename(filename).replace('.pdf', '.txt')
+    return send_file(buf, as_attachment=True, download_name=download_name, mimetype=mime_type)
 
-    return send_file(temp_path, as_attachment=True, download_name=filename.replace('.pdf', '.txt'), mimetype=mime_type)
+# Built once at import; lambda_stmt caches the compiled SQL so the hot
+# dashboard query is not rebuilt and recompiled on every request. The
+# database truncates raw_response so only the snippet is transferred.
+RECENT_LOGS_STMT = lambda_stmt(
+    lambda: db.select(
+        CaseQueryLog.id,
+        CaseQueryLog.timestamp,
+        CaseQueryLog.case_type,
+        CaseQueryLog.case_number,
+        CaseQueryLog.filing_year,
+        CaseQueryLog.status,
+        db.func.substr(CaseQueryLog.raw_response, 1, 50).label('snippet'),
+    )
+    .order_by(CaseQueryLog.timestamp.desc())
+    .limit(10)
+)
 
 @app.route('/api/logs', methods=['GET'])
 def get_logs():
-    """API endpoint to fetch recent query logs for the admin/status dashboard."""
-    logs = CaseQueryLog.query.order_by(CaseQueryLog.timestamp.desc()).limit(10).all()
+    """
+    API endpoint to fetch recent query logs for the admin/status dashboard.
+
+    Rows are fetched as plain Core tuples rather than ORM objects. A bulk
+    export should reuse the same select with .execution_options(yield_per=500)
+    and stream the rows from a generator to keep memory flat.
+    """
+    logs = db.session.execute(RECENT_LOGS_STMT).all()
     
     logs_data = []
     for log in logs:
         logs_data.append({
-            'timestamp': log.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': log.timestamp,
             'case_type': log.case_type,
             'case_number': log.case_number,
             'filing_year': log.filing_year,
             'status': log.status,
-            'raw_response_snippet': log.raw_response[:50] + '...'
+            'raw_response_snippet': log.snippet + '...'
         })
     return jsonify(logs_data)
 
 
 # --- Application Setup ---
 
-# Create database tables upon first run
-@app.before_request
 def create_tables():
-    """Creates all database tables defined in the models."""
+    """Creates all database tables (and any indexes missing from existing tables)."""
     db.create_all()
+    for index in CaseQueryLog.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+
+# Create database tables once at startup rather than on every request
+with app.app_context():
+    create_tables()
+start_log_writer()
+threading.Thread(target=fill_captcha_pool, name='captcha-pool', daemon=True).start()
 
 if __name__ == '__main__':
-    # Ensure tables are created before running
-    with app.app_context():
-        create_tables()
-    app.run(debug=True)
\ No newline at end of file
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1')
\ No newline at end of file
@@ -1,9 +1,28 @@
+import sqlite3
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from datetime import datetime
 
 # Initialize SQLAlchemy instance
 db = SQLAlchemy()
 
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tunes every new SQLite connection: WAL journaling with synchronous=NORMAL
+    to cut fsyncs per commit, a 64 MB page cache, in-memory temp tables and
+    a 256 MB memory-mapped I/O window.
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 class CaseQueryLog(db.Model):
     """
     Database model for storing records of all case searches made by the scraper.
@@ -23,5 +42,8 @@ class CaseQueryLog(db.Model):
     # Metadata
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Serves the "most recent logs first" query without a full scan + sort
+    __table_args__ = (db.Index('ix_log_ts_desc', timestamp.desc()),)
+
     def __repr__(self):
         return f"QueryLog('{self.case_type}', '{self.case_number}/{self.filing_year}', '{self.status}')"
@@ -0,0 +1,13 @@
+# Gunicorn configuration for production deployments: gunicorn app:app
+import os
+
+bind = '0.0.0.0:8000'
+
+# CAPTCHA challenges and the scrape cache live in process memory, so a
+# challenge must be verified by the worker that issued it. Run a single
+# process by default and scale with threads: a slow scrape only ties up one
+# thread rather than the whole server. Raise WEB_CONCURRENCY only once that
+# state is moved to a shared store such as Redis.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('WEB_THREADS', 32))  # Also sizes the DB pool in app.py